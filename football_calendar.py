@@ -5,23 +5,63 @@ Automatically adds your favorite football team's fixtures to Google Calendar
 """
 
 import os
+import contextlib
+import functools
 import sys
+import json
+import tempfile
+import threading
 import datetime
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
 from pathlib import Path
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
+from google_auth_httplib2 import AuthorizedHttp
 from google_auth_oauthlib.flow import InstalledAppFlow
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import BatchHttpRequest, build_http
 
 # Google Calendar API scope
 SCOPES = ['https://www.googleapis.com/auth/calendar']
 
+# Maximum number of calls Google accepts in a single batch request
+MAX_BATCH_SIZE = 50
+
+# Parallel imports used when a batch request fails as a whole
+MAX_IMPORT_WORKERS = 8
+
+# Batch failures that individual requests can get past (bad or oversized
+# batch body); rate limits and server errors would just fail again
+BATCH_FALLBACK_STATUSES = (400, 413)
+
 # Football-data.org API configuration
 FOOTBALL_API_BASE_URL = 'https://api.football-data.org/v4'
 
+# Concurrent fixture requests when syncing several teams
+MAX_FETCH_WORKERS = 8
+
+# Last fixtures response per team, revalidated with its ETag
+FIXTURES_CACHE_FILE = '.fixtures_cache.json'
+
+# Teams not fetched for this many days are dropped from the fixtures cache
+FIXTURES_CACHE_MAX_AGE_DAYS = 30
+
+# Kickoff times of matches already added to the calendar, by match ID
+SYNCED_MATCHES_FILE = 'synced_matches.json'
+
+
+class MissingCredentialsError(Exception):
+    """Raised when an API key or Google OAuth credentials are not available"""
+
+
+# Credentials loaded from token.json, keyed by the file's path and modification time
+_CREDS_CACHE = {}
+
 # Popular teams mapping (team name -> team ID)
 POPULAR_TEAMS = {
     'dortmund': {'id': 4, 'name': 'Borussia Dortmund', 'competition': 'BL1'},
@@ -39,26 +79,75 @@ POPULAR_TEAMS = {
     'milan': {'id': 98, 'name': 'AC Milan', 'competition': 'SA'},
 }
 
+# Teams in menu order, and a lookup by full team name
+_TEAMS_SORTED = tuple(sorted(POPULAR_TEAMS.items()))
+_NAME_LC = {team['name'].lower(): team for team in POPULAR_TEAMS.values()}
+
+
+def _build_token_index() -> Dict[str, List[Dict]]:
+    """Index teams by their key and by each word of their name"""
+    index = {}
+    for key, team in POPULAR_TEAMS.items():
+        for token in [key, *team['name'].lower().split()]:
+            teams = index.setdefault(token, [])
+            if team not in teams:
+                teams.append(team)
+    return index
+
+
+_TOKEN_INDEX = _build_token_index()
+
+
+def _parse_utc(value: str) -> datetime.datetime:
+    """Parse a football-data.org 'YYYY-MM-DDTHH:MM:SSZ' timestamp"""
+    return datetime.datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                             int(value[11:13]), int(value[14:16]), int(value[17:19]),
+                             tzinfo=datetime.timezone.utc)
+
+
+def _atomic_write(path: str, text: str):
+    """Write text to path through a temporary file so readers never see a partial file"""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
 
 def load_env_file():
     """Load environment variables from .env file"""
     env_file = Path('.env')
     if env_file.exists():
-        with open(env_file) as f:
+        with open(env_file, encoding='utf-8') as f:
             for line in f:
                 line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip().strip('"').strip("'")
-                    if key and value:
-                        os.environ[key] = value
+                if not line or line[0] == '#' or '=' not in line:
+                    continue
+                key, _, value = line.partition('=')
+                key = key.strip()
+                value = value.strip().strip('"\'')
+                if key and value:
+                    os.environ[key] = value
 
 
 class FootballCalendarSync:
     def __init__(self, api_key: str):
         self.api_key = api_key
         self.calendar_service = None
+        self._credentials = None
+        self._thread_local = threading.local()
+        
+        # Reuse connections to football-data.org across requests
+        self._adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_FETCH_WORKERS)
+        self.session = self._new_session()
+        
+        self._fixtures_cache = self._load_fixtures_cache()
+        self._fixtures_cache_lock = threading.Lock()
+        self._synced = self._load_synced_matches()
         
     def authenticate_google_calendar(self):
         """Authenticate with Google Calendar API"""
@@ -66,7 +155,11 @@ class FootballCalendarSync:
         
         # Token file stores the user's access and refresh tokens
         if os.path.exists('token.json'):
-            creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+            cache_key = (os.path.abspath('token.json'), os.path.getmtime('token.json'))
+            creds = _CREDS_CACHE.get(cache_key)
+            if creds is None:
+                creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+                _CREDS_CACHE[cache_key] = creds
         
         # If there are no (valid) credentials available, let the user log in
         if not creds or not creds.valid:
@@ -74,32 +167,82 @@ class FootballCalendarSync:
                 creds.refresh(Request())
             else:
                 if not os.path.exists('credentials.json'):
-                    print("\n❌ Error: credentials.json not found!")
-                    print("Please follow the setup instructions in README.md")
-                    sys.exit(1)
+                    raise MissingCredentialsError("credentials.json not found!")
                     
                 flow = InstalledAppFlow.from_client_secrets_file(
                     'credentials.json', SCOPES)
                 creds = flow.run_local_server(port=0)
             
             # Save the credentials for the next run
-            with open('token.json', 'w') as token:
-                token.write(creds.to_json())
+            _atomic_write('token.json', creds.to_json())
+            _CREDS_CACHE[(os.path.abspath('token.json'), os.path.getmtime('token.json'))] = creds
         
+        self._credentials = creds
+        # The bundled discovery document is already the default; state it
+        # explicitly and skip the discovery cache, which it doesn't need
+        self.calendar_service = build('calendar', 'v3', credentials=creds,
+                                      static_discovery=True, cache_discovery=False)
+        print("✅ Successfully authenticated with Google Calendar")
+    
+    def _new_session(self) -> requests.Session:
+        """Create a session that shares the connection pool of the adapter"""
+        session = requests.Session()
+        session.headers.update({'X-Auth-Token': self.api_key})
+        session.mount('https://', self._adapter)
+        return session
+    
+    def _load_fixtures_cache(self) -> Dict:
+        """Load cached fixtures responses from disk"""
         try:
-            self.calendar_service = build('calendar', 'v3', credentials=creds)
-            print("✅ Successfully authenticated with Google Calendar")
-        except HttpError as error:
-            print(f"❌ An error occurred: {error}")
-            sys.exit(1)
+            with open(FIXTURES_CACHE_FILE) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
     
-    def get_team_fixtures(self, team_id: int, days_ahead: int = 90) -> List[Dict]:
-        """Fetch upcoming fixtures for a team"""
-        headers = {'X-Auth-Token': self.api_key}
+    def _save_fixtures_cache(self, team_id: int, etag: str, matches: List[Dict]):
+        """Store a team's fixtures response and its ETag on disk"""
+        today = datetime.date.today()
+        cutoff = (today - datetime.timedelta(days=FIXTURES_CACHE_MAX_AGE_DAYS)).isoformat()
         
+        with self._fixtures_cache_lock:
+            self._fixtures_cache[str(team_id)] = {
+                'etag': etag,
+                'matches': matches,
+                'fetched': today.isoformat(),
+            }
+            # Forget teams that have not been fetched recently
+            self._fixtures_cache = {
+                key: entry for key, entry in self._fixtures_cache.items()
+                if entry.get('fetched', '') >= cutoff
+            }
+            try:
+                _atomic_write(FIXTURES_CACHE_FILE, json.dumps(self._fixtures_cache))
+            except OSError as e:
+                print(f"⚠️  Could not update fixtures cache: {e}")
+    
+    def _load_synced_matches(self) -> Dict[int, str]:
+        """Load the kickoff times of matches synced by previous runs"""
+        try:
+            with open(SYNCED_MATCHES_FILE) as f:
+                data = json.load(f)
+            return {int(match_id): utc_date for match_id, utc_date in data.items()}
+        except (OSError, ValueError, AttributeError):
+            return {}
+    
+    def _save_synced_matches(self):
+        """Atomically write the kickoff times of synced matches to disk"""
+        try:
+            _atomic_write(SYNCED_MATCHES_FILE, json.dumps(self._synced, sort_keys=True))
+        except OSError as e:
+            print(f"⚠️  Could not save synced matches: {e}")
+    
+    def get_team_fixtures(self, team_id: int, days_ahead: int = 90,
+                          session: Optional[requests.Session] = None) -> List[Dict]:
+        """Fetch upcoming fixtures for a team"""
         # Calculate date range
-        date_from = datetime.date.today().isoformat()
-        date_to = (datetime.date.today() + datetime.timedelta(days=days_ahead)).isoformat()
+        today = datetime.date.today()
+        date_from = today.isoformat()
+        date_to = (today + datetime.timedelta(days=days_ahead)).isoformat()
         
         url = f"{FOOTBALL_API_BASE_URL}/teams/{team_id}/matches"
         params = {
@@ -108,79 +251,202 @@ class FootballCalendarSync:
             'status': 'SCHEDULED'
         }
         
+        # Only download the fixtures again if they changed since the last run
+        cached = self._fixtures_cache.get(str(team_id))
+        headers = {'If-None-Match': cached['etag']} if cached else {}
+        
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = (session or self.session).get(url, params=params, headers=headers, timeout=10)
+            if response.status_code == 304 and cached:
+                if cached.get('fetched') != today.isoformat():
+                    self._save_fixtures_cache(team_id, cached['etag'], cached['matches'])
+                return cached['matches']
             response.raise_for_status()
-            data = response.json()
-            return data.get('matches', [])
-        except requests.exceptions.RequestException as e:
+            data = orjson.loads(response.content)
+            matches = data.get('matches', [])
+            
+            etag = response.headers.get('ETag')
+            if etag:
+                self._save_fixtures_cache(team_id, etag, matches)
+            return matches
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             print(f"❌ Error fetching fixtures: {e}")
             return []
     
-    def create_calendar_event(self, match: Dict, calendar_id: str = 'primary') -> bool:
-        """Create a calendar event for a match"""
-        try:
-            # Parse match data
-            home_team = match['homeTeam']['name']
-            away_team = match['awayTeam']['name']
-            competition = match['competition']['name']
-            match_date = match['utcDate']
-            
-            # Create event
-            event = {
-                'summary': f"⚽ {home_team} vs {away_team}",
-                'description': f"{competition}\n\nHome: {home_team}\nAway: {away_team}",
-                'start': {
-                    'dateTime': match_date,
-                    'timeZone': 'UTC',
-                },
-                'end': {
-                    'dateTime': (datetime.datetime.fromisoformat(match_date.replace('Z', '+00:00')) + 
-                               datetime.timedelta(hours=2)).isoformat(),
-                    'timeZone': 'UTC',
-                },
-                'reminders': {
-                    'useDefault': False,
-                    'overrides': [
-                        {'method': 'popup', 'minutes': 60},
-                        {'method': 'popup', 'minutes': 15},
-                    ],
-                },
-            }
-            
-            # Check if event already exists
-            existing_events = self.calendar_service.events().list(
+    def get_existing_events(self, fixtures: List[Dict], calendar_id: str = 'primary') -> set:
+        """Fetch calendar events covering the fixtures window in a single listing"""
+        # utcDate strings share one UTC format, so they order chronologically
+        match_dates = [match['utcDate'] for match in fixtures]
+        time_min = min(match_dates)
+        last_start = _parse_utc(max(match_dates))
+        time_max = (last_start + datetime.timedelta(minutes=1)).isoformat()
+        
+        existing = set()
+        page_token = None
+        while True:
+            response = self.calendar_service.events().list(
                 calendarId=calendar_id,
-                timeMin=match_date,
-                timeMax=(datetime.datetime.fromisoformat(match_date.replace('Z', '+00:00')) + 
-                        datetime.timedelta(minutes=1)).isoformat(),
-                q=f"{home_team} vs {away_team}",
-                singleEvents=True
+                timeMin=time_min,
+                timeMax=time_max,
+                singleEvents=True,
+                maxResults=2500,
+                pageToken=page_token
             ).execute()
             
-            if existing_events.get('items'):
-                print(f"⏭️  Skipping (already exists): {home_team} vs {away_team}")
-                return False
+            for item in response.get('items', []):
+                start = item.get('start', {}).get('dateTime')
+                if start:
+                    existing.add((datetime.datetime.fromisoformat(start.replace('Z', '+00:00')),
+                                  item.get('summary', '')))
             
-            # Create the event
-            event = self.calendar_service.events().insert(
+            page_token = response.get('nextPageToken')
+            if not page_token:
+                return existing
+    
+    def prepare_calendar_event(self, match: Dict, existing: set) -> Optional[Dict]:
+        """Build the calendar event for a match, or None if it already exists"""
+        # Parse match data
+        home_team = match['homeTeam']['name']
+        away_team = match['awayTeam']['name']
+        competition = match['competition']['name']
+        match_date = match['utcDate']
+        start_time = _parse_utc(match_date)
+        summary = f"⚽ {home_team} vs {away_team}"
+        
+        # Check if event already exists; a synced match whose kickoff time
+        # changed is imported again so Google moves the event
+        if self._synced.get(match['id']) == match_date or (start_time, summary) in existing:
+            self._synced[match['id']] = match_date
+            print(f"⏭️  Skipping (already exists): {home_team} vs {away_team}")
+            return None
+        existing.add((start_time, summary))
+        
+        return {
+            # Stable UID so Google updates the event instead of duplicating it
+            'iCalUID': f"fb-{match['id']}@football-calendar",
+            'summary': summary,
+            'description': f"{competition}\n\nHome: {home_team}\nAway: {away_team}",
+            'start': {
+                'dateTime': match_date,
+                'timeZone': 'UTC',
+            },
+            'end': {
+                'dateTime': (start_time + datetime.timedelta(hours=2)).isoformat(),
+                'timeZone': 'UTC',
+            },
+            'reminders': {
+                'useDefault': False,
+                'overrides': [
+                    {'method': 'popup', 'minutes': 60},
+                    {'method': 'popup', 'minutes': 15},
+                ],
+            },
+        }
+    
+    def _thread_http(self) -> AuthorizedHttp:
+        """Return an authorized HTTP client owned by the current thread"""
+        # httplib2 connections are not thread-safe, so each worker gets its own
+        http = getattr(self._thread_local, 'http', None)
+        if http is None:
+            http = AuthorizedHttp(self._credentials, http=build_http())
+            self._thread_local.http = http
+        return http
+    
+    def _import_event(self, match: Dict, event: Dict, calendar_id: str = 'primary',
+                      http: Optional[AuthorizedHttp] = None) -> bool:
+        """Import a prepared event for a match into the calendar"""
+        home_team = match['homeTeam']['name']
+        away_team = match['awayTeam']['name']
+        
+        try:
+            self.calendar_service.events().import_(
                 calendarId=calendar_id, 
                 body=event
-            ).execute()
-            
-            print(f"✅ Added: {home_team} vs {away_team} on {match_date[:10]}")
-            return True
-            
+            ).execute(http=http)
         except HttpError as error:
-            print(f"❌ Error creating event: {error}")
+            print(f"❌ Error creating event for {home_team} vs {away_team}: {error}")
             return False
+        
+        self._synced[match['id']] = match['utcDate']
+        print(f"✅ Added: {home_team} vs {away_team} on {match['utcDate'][:10]}")
+        return True
     
-    def sync_team_fixtures(self, team_id: int, team_name: str, days_ahead: int = 90):
-        """Main function to sync team fixtures to calendar"""
-        print(f"\n🔄 Fetching fixtures for {team_name}...")
+    def create_calendar_event(self, match: Dict, existing: set, calendar_id: str = 'primary') -> bool:
+        """Create a calendar event for a match"""
+        event = self.prepare_calendar_event(match, existing)
+        if event is None:
+            return False
         
-        fixtures = self.get_team_fixtures(team_id, days_ahead)
+        return self._import_event(match, event, calendar_id)
+    
+    def _on_insert(self, pending: Dict[str, tuple], added: List[Dict],
+                   request_id: str, response: Dict, exception: Optional[HttpError]):
+        """Batch callback reporting the result of a single event import"""
+        match, _ = pending.pop(request_id)
+        home_team = match['homeTeam']['name']
+        away_team = match['awayTeam']['name']
+        
+        if exception is not None:
+            print(f"❌ Error creating event for {home_team} vs {away_team}: {exception}")
+            return
         
+        added.append(match)
+        self._synced[match['id']] = match['utcDate']
+        print(f"✅ Added: {home_team} vs {away_team} on {match['utcDate'][:10]}")
+    
+    def _execute_batch(self, batch: BatchHttpRequest, pending: Dict[str, tuple],
+                       added: List[Dict], calendar_id: str):
+        """Send a batch of imports, importing them in parallel if the batch is rejected"""
+        try:
+            batch.execute()
+        except HttpError as error:
+            if error.resp.status not in BATCH_FALLBACK_STATUSES:
+                raise
+            
+            print(f"⚠️  Batch request failed, adding events one by one: {error}")
+            items = list(pending.values())
+            pending.clear()
+            
+            with ThreadPoolExecutor(max_workers=MAX_IMPORT_WORKERS) as executor:
+                results = executor.map(
+                    lambda item: self._import_event(*item, calendar_id, http=self._thread_http()),
+                    items)
+                added.extend(match for (match, _), ok in zip(items, results) if ok)
+    
+    def add_calendar_events(self, fixtures: List[Dict], existing: set, calendar_id: str = 'primary') -> int:
+        """Add events for all new fixtures using batched HTTP requests"""
+        pending = {}
+        added = []
+        
+        batch = None
+        for idx, match in enumerate(fixtures):
+            event = self.prepare_calendar_event(match, existing)
+            if event is None:
+                continue
+            
+            if batch is None:
+                batch = self.calendar_service.new_batch_http_request(
+                    callback=functools.partial(self._on_insert, pending, added))
+            
+            request_id = str(idx)
+            pending[request_id] = (match, event)
+            batch.add(self.calendar_service.events().import_(
+                calendarId=calendar_id,
+                body=event
+            ), request_id=request_id)
+            
+            # Google limits the number of calls per batch request
+            if len(pending) == MAX_BATCH_SIZE:
+                self._execute_batch(batch, pending, added, calendar_id)
+                batch = None
+        
+        if batch is not None:
+            self._execute_batch(batch, pending, added, calendar_id)
+        
+        return len(added)
+    
+    def _sync_fixtures(self, fixtures: List[Dict]):
+        """Add the given fixtures to the calendar, skipping existing ones"""
         if not fixtures:
             print("❌ No upcoming fixtures found or API error")
             return
@@ -188,26 +454,59 @@ class FootballCalendarSync:
         print(f"\n📅 Found {len(fixtures)} upcoming matches")
         print("\n" + "="*60)
         
-        added_count = 0
-        for match in fixtures:
-            if self.create_calendar_event(match):
-                added_count += 1
+        # Only look at the calendar for matches new or rescheduled since the last run
+        new_fixtures = [match for match in fixtures
+                        if self._synced.get(match['id']) != match['utcDate']]
+        
+        try:
+            existing = self.get_existing_events(new_fixtures) if new_fixtures else set()
+            added_count = self.add_calendar_events(fixtures, existing)
+        except HttpError as error:
+            print(f"❌ An error occurred: {error}")
+            return
+        finally:
+            self._save_synced_matches()
         
         print("="*60)
         print(f"\n✨ Successfully added {added_count} new matches to your calendar!")
+    
+    def sync_team_fixtures(self, team_id: int, team_name: str, days_ahead: int = 90):
+        """Main function to sync team fixtures to calendar"""
+        print(f"\n🔄 Fetching fixtures for {team_name}...")
+        
+        fixtures = self.get_team_fixtures(team_id, days_ahead)
+        self._sync_fixtures(fixtures)
+    
+    def fetch_all_fixtures(self, team_ids: List[int], days_ahead: int = 90) -> List[List[Dict]]:
+        """Fetch upcoming fixtures for several teams concurrently"""
+        if not team_ids:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(len(team_ids), MAX_FETCH_WORKERS)) as executor:
+            return list(executor.map(
+                # Sessions aren't thread-safe, so each fetch gets its own on the shared pool
+                lambda team_id: self.get_team_fixtures(team_id, days_ahead, self._new_session()),
+                team_ids))
+    
+    def sync_many_teams(self, teams: List[Dict], days_ahead: int = 90):
+        """Sync fixtures for several teams, fetching them all at once"""
+        print(f"\n🔄 Fetching fixtures for {len(teams)} teams...")
+        
+        all_fixtures = self.fetch_all_fixtures([team['id'] for team in teams], days_ahead)
+        
+        for team, fixtures in zip(teams, all_fixtures):
+            print(f"\n⚽ {team['name']}")
+            self._sync_fixtures(fixtures)
 
 
 def display_team_selection():
     """Display available teams for selection"""
-    print("\n⚽ Football Calendar Sync")
-    print("="*60)
-    print("\nAvailable teams:")
-    print()
+    lines = ["\n⚽ Football Calendar Sync", "="*60, "\nAvailable teams:", ""]
+    lines.extend(f"  {idx:2d}. {team['name']}" for idx, (key, team) in enumerate(_TEAMS_SORTED, 1))
+    lines.append("\n  Or type a team name to search\n")
     
-    for idx, (key, team) in enumerate(sorted(POPULAR_TEAMS.items()), 1):
-        print(f"  {idx:2d}. {team['name']}")
-    
-    print(f"\n  Or type a team name to search\n")
+    # Write the whole menu at once rather than one print per line
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def get_user_team_choice() -> Optional[Dict]:
@@ -219,14 +518,22 @@ def get_user_team_choice() -> Optional[Dict]:
     # Check if it's a number
     if choice.isdigit():
         idx = int(choice) - 1
-        teams_list = sorted(POPULAR_TEAMS.items())
-        if 0 <= idx < len(teams_list):
-            key, team = teams_list[idx]
+        if 0 <= idx < len(_TEAMS_SORTED):
+            key, team = _TEAMS_SORTED[idx]
             return team
     
     # Check if it's a team name
     if choice in POPULAR_TEAMS:
         return POPULAR_TEAMS[choice]
+    if choice in _NAME_LC:
+        return _NAME_LC[choice]
+    
+    # Search for a word of a team name
+    matches = _TOKEN_INDEX.get(choice)
+    if matches:
+        team = matches[0]
+        print(f"\n✅ Found: {team['name']}")
+        return team
     
     # Search for partial match
     for key, team in POPULAR_TEAMS.items():
@@ -238,16 +545,24 @@ def get_user_team_choice() -> Optional[Dict]:
     return None
 
 
+def get_football_api_key() -> str:
+    """Get the football-data.org API key from the environment"""
+    api_key = os.environ.get('FOOTBALL_API_KEY')
+    if not api_key:
+        raise MissingCredentialsError("FOOTBALL_API_KEY environment variable not set!")
+    return api_key
+
+
 def main():
     """Main entry point"""
     # Load .env file if it exists
     load_env_file()
     
     # Check for API key
-    api_key = os.environ.get('FOOTBALL_API_KEY')
-    
-    if not api_key:
-        print("\n❌ Error: FOOTBALL_API_KEY environment variable not set!")
+    try:
+        api_key = get_football_api_key()
+    except MissingCredentialsError as error:
+        print(f"\n❌ Error: {error}")
         print("\nPlease follow these steps:")
         print("1. Get a free API key from https://www.football-data.org/")
         print("2. Set the environment variable:")
@@ -265,7 +580,15 @@ def main():
     sync = FootballCalendarSync(api_key)
     
     # Authenticate with Google Calendar
-    sync.authenticate_google_calendar()
+    try:
+        sync.authenticate_google_calendar()
+    except MissingCredentialsError as error:
+        print(f"\n❌ Error: {error}")
+        print("Please follow the setup instructions in README.md")
+        sys.exit(1)
+    except HttpError as error:
+        print(f"❌ An error occurred: {error}")
+        sys.exit(1)
     
     # Sync fixtures
     sync.sync_team_fixtures(team['id'], team['name'])